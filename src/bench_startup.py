@@ -0,0 +1,60 @@
+import os
+import subprocess
+import sys
+import time
+
+SRC_DIR = os.path.dirname(os.path.abspath(__file__))
+MAIN_PATH = os.path.join(SRC_DIR, "main.py")
+TARGET_MS = 50
+USAGE = "usage: bench_startup.py [FILE] [RUNS]"
+
+
+def import_time_us(args):
+    # sums the self time of every import reported by -X importtime
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", *args],
+        capture_output=True,
+        text=True,
+        check=True
+    )
+    total = 0
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        self_us = line.removeprefix("import time:").split("|")[0].strip()
+        if self_us.isdigit():
+            total += int(self_us)
+    return total
+
+
+def wall_time_ms(args):
+    start = time.perf_counter()
+    subprocess.run([sys.executable, *args], capture_output=True, check=True)
+    return (time.perf_counter() - start) * 1000
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    file_path = argv[0] if argv else os.path.join(SRC_DIR, "..", "test_file.mc")
+    try:
+        runs = int(argv[1]) if len(argv) > 1 else 10
+    except ValueError:
+        runs = 0
+    if runs < 1:
+        sys.exit(f"{USAGE}\nerror: RUNS must be a positive integer")
+    main_args = [MAIN_PATH, file_path]
+    base_args = ["-c", "pass"]
+
+    import_overhead = sorted(import_time_us(main_args) - import_time_us(base_args) for _ in range(runs))
+    wall_main = sorted(wall_time_ms(main_args) for _ in range(runs))
+    wall_base = sorted(wall_time_ms(base_args) for _ in range(runs))
+
+    import_ms = import_overhead[runs // 2] / 1000
+    print(f"import overhead: {import_ms:.2f} ms (median of {runs}, target < {TARGET_MS} ms)")
+    print(f"cold start:      {wall_main[runs // 2]:.2f} ms")
+    print(f"bare python:     {wall_base[runs // 2]:.2f} ms")
+    return 0 if import_ms < TARGET_MS else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,20 +1,66 @@
-from nc_tok import Lexer
-from nc_ast import Parser
-from nc_transpiler import Transpiler
+import os
+import sys
 
-out_file = "out.nc"
+USAGE = "usage: main.py [-o OUTPUT] [FILE]\n       main.py --watch [-o OUT_DIR] [SRC_DIR]"
 
-with open("test_file.mc") as f:
-    contents = f.read()
 
-lexer = Lexer(contents, "test_file.mc")
-tokens = lexer.get_tokens()
-# print(tokens)
+def parse_args(argv):
+    # a hand-written parser is used because argparse alone doubles the import time
+    file_path = None
+    output = None
+    watch = False
+    args = iter(argv)
+    for arg in args:
+        if arg in ("-h", "--help"):
+            print(USAGE)
+            sys.exit(0)
+        elif arg == "--watch":
+            watch = True
+        elif arg in ("-o", "--output"):
+            output = next(args, None)
+            if output is None:
+                sys.exit(f"{USAGE}\nerror: {arg} expects a path")
+        elif arg.startswith("-"):
+            sys.exit(f"{USAGE}\nerror: unknown option {arg}")
+        else:
+            file_path = arg
 
-parser = Parser(tokens)
-node = parser.parse()
-# node.tree()
+    if file_path is None:
+        file_path = "." if watch else "test_file.mc"
+    return file_path, output, watch
 
-transpiler = Transpiler(node)
-text = transpiler.compile()
-print(text)
+
+def main(argv=None):
+    file_path, output, watch = parse_args(sys.argv[1:] if argv is None else argv)
+
+    if watch:
+        if not os.path.isdir(file_path):
+            sys.exit(f"{USAGE}\nerror: {file_path} is not a directory")
+        from nc_watch import Watcher
+        Watcher(file_path, output).watch()
+        return 0
+
+    # imported here so that the transpiler is only loaded when a file is actually transpiled
+    from nc_tok import LexerSyntaxError
+    from nc_ast import ParserError
+    from nc_types import NCTypeError
+    from nc_transpiler import transpile
+
+    try:
+        with open(file_path, encoding="utf-8") as f:
+            contents = f.read()
+
+        text = transpile(contents, file_path)
+
+        if output is None:
+            print(text)
+        else:
+            with open(output, "w", encoding="utf-8") as f:
+                f.write(text)
+    except (OSError, UnicodeDecodeError, LexerSyntaxError, ParserError, NCTypeError) as e:
+        sys.exit(str(e))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
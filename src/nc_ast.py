@@ -1,6 +1,6 @@
 from nc_tok import TokType
 from nc_types import NCInt, NCMut
-from nc_node import *
+from nc_node import NodeType, BinNode, LiteralNode, FuncDefNode, ScopeNode, VarDefNode, tok_type_to_bin_node_type
 
 
 class ParserError(Exception):
@@ -72,6 +72,8 @@ class Parser:
             return self.parse_block()
         elif self.tok == (TokType.KW, "var"):
             return self.parse_var_declaration()
+        else:
+            raise ParserError("expected a statement", self.tok.start, self.tok.end)
 
     def parse_var_declaration(self):
         start = self.tok.start
@@ -1,6 +1,6 @@
 from abc import ABC as _ABC
 from enum import Enum as _Enum, auto as _auto
-from typing import Any, Sequence
+from collections.abc import Sequence
 
 from nc_tok import TokType as _TokType, Pos as _Pos
 from nc_types import NCType
@@ -93,9 +93,9 @@ class BinNode(Node):
 
 
 class LiteralNode(Node):
-    def __init__(self, value: Any, *args, **kwargs):
+    def __init__(self, value: object, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        self.value: Any = value
+        self.value: object = value
 
 
 class FuncDefNode(Node):
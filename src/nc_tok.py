@@ -1,6 +1,7 @@
 from enum import Enum, auto
 
-KEYWORDS = "i32", "fn", "var"
+KEYWORDS = frozenset(("i32", "fn", "var"))
+DIGITS = frozenset("0123456789")
 
 
 class Pos:
@@ -164,7 +165,7 @@ class Lexer:
         if self.c is None:
             return Tok(self.pos(), self.pos(), TokType.EOF)
 
-        if self.c in "0123456789":
+        if self.c in DIGITS:
             return self.parse_number()
         elif self.c.isalpha():
             return self.parse_ident()
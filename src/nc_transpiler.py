@@ -1,6 +1,8 @@
 from io import StringIO, IOBase, SEEK_SET
 
-from nc_node import *
+from nc_tok import Lexer
+from nc_ast import Parser
+from nc_node import NodeType, BinNode, LiteralNode, FuncDefNode, ScopeNode, VarDefNode
 
 
 class Transpiler:
@@ -117,3 +119,14 @@ class Transpiler:
         self.__append(node.type_id.var_c_type() + " " + node.name + " = ")
         self.__compile_node(node.value)
         self.__append(";")
+
+
+def transpile(contents, path):
+    lexer = Lexer(contents, path)
+    tokens = lexer.get_tokens()
+
+    parser = Parser(tokens)
+    node = parser.parse()
+
+    transpiler = Transpiler(node)
+    return transpiler.compile()
@@ -0,0 +1,168 @@
+import os
+import time
+from hashlib import sha256
+
+from nc_tok import LexerSyntaxError
+from nc_ast import ParserError
+from nc_types import NCTypeError
+from nc_transpiler import transpile
+
+SOURCE_EXT = ".mc"
+OUTPUT_EXT = ".c"
+
+
+class ManifestEntry:
+    def __init__(self, mtime_ns, size, digest, failed=False):
+        self.mtime_ns = mtime_ns
+        self.size = size
+        self.digest = digest
+        # set when the file could not be built, it is retried when its own stat changes
+        self.failed = failed
+
+    def __repr__(self):
+        digest = None if self.digest is None else self.digest[:12]
+        return f"ManifestEntry(mtime_ns={self.mtime_ns}, size={self.size}, digest={digest}, failed={self.failed})"
+
+
+class Watcher:
+    def __init__(self, src_dir, out_dir=None, interval=0.5, debounce=0.2):
+        self.src_dir = src_dir
+        self.out_dir = src_dir if out_dir is None else out_dir
+        self.interval = interval
+        self.debounce = debounce
+        self.manifest: dict[str, ManifestEntry] = {}
+
+    def source_files(self):
+        for dir_path, dir_names, file_names in os.walk(self.src_dir):
+            dir_names[:] = [name for name in dir_names if not name.startswith(".")]
+            for name in file_names:
+                if name.endswith(SOURCE_EXT):
+                    yield os.path.join(dir_path, name)
+
+    def output_path(self, src_path):
+        rel_path = os.path.relpath(src_path, self.src_dir)
+        return os.path.join(self.out_dir, rel_path.removesuffix(SOURCE_EXT) + OUTPUT_EXT)
+
+    def stat_files(self):
+        stats = {}
+        for path in self.source_files():
+            try:
+                st = os.stat(path)
+            except FileNotFoundError:
+                continue
+            stats[path] = st.st_mtime_ns, st.st_size
+        return stats
+
+    def changed_files(self, stats):
+        changed = []
+        for path, (mtime_ns, size) in stats.items():
+            entry = self.manifest.get(path)
+            if entry is None or entry.mtime_ns != mtime_ns or entry.size != size:
+                changed.append(path)
+        return changed
+
+    def wait_for_quiet(self, stats):
+        # keep polling until a full debounce period passes with no new writes,
+        # so that a burst of saves results in a single rebuild
+        while True:
+            time.sleep(self.debounce)
+            new_stats = self.stat_files()
+            if new_stats == stats:
+                return stats
+            stats = new_stats
+
+    def build(self, stats):
+        written = []
+        for path in self.changed_files(stats):
+            mtime_ns, size = stats[path]
+            try:
+                with open(path, "rb") as f:
+                    data = f.read()
+            except OSError as e:
+                print(e)
+                self.manifest[path] = ManifestEntry(mtime_ns, size, None, failed=True)
+                continue
+
+            digest = sha256(data).hexdigest()
+            entry = self.manifest.get(path)
+            if entry is not None and entry.digest == digest and not entry.failed:
+                entry.mtime_ns, entry.size = mtime_ns, size
+                continue
+
+            built = self.build_file(path, data)
+            self.manifest[path] = ManifestEntry(mtime_ns, size, digest, failed=built is None)
+            if built:
+                written.append(path)
+
+        for path in list(self.manifest):
+            if path not in stats:
+                del self.manifest[path]
+                self.remove_output(path)
+        return written
+
+    def build_file(self, path, data):
+        # returns True if the output was written, False if it was already up
+        # to date and None if the file could not be built
+        out_path = self.output_path(path)
+        try:
+            text = transpile(data.decode("utf-8"), path)
+        except (UnicodeDecodeError, LexerSyntaxError, ParserError, NCTypeError) as e:
+            print(f"{path}: {e}")
+            return None
+
+        try:
+            with open(out_path, encoding="utf-8") as f:
+                if f.read() == text:
+                    return False
+        except (OSError, UnicodeDecodeError):
+            # a missing or unreadable output is simply overwritten
+            pass
+
+        try:
+            self.write_output(out_path, text)
+        except OSError as e:
+            print(e)
+            return None
+        print(f"{path} -> {out_path}")
+        return True
+
+    @staticmethod
+    def write_output(out_path, text):
+        # the text is written to a temporary file that then replaces the output,
+        # so that a C build never sees a truncated or half-written file
+        out_dir = os.path.dirname(out_path) or "."
+        os.makedirs(out_dir, exist_ok=True)
+        tmp_path = os.path.join(out_dir, f".{os.path.basename(out_path)}.{os.getpid()}.tmp")
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                f.write(text)
+            os.replace(tmp_path, out_path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    def remove_output(self, path):
+        out_path = self.output_path(path)
+        try:
+            os.remove(out_path)
+        except FileNotFoundError:
+            return
+        except OSError as e:
+            print(e)
+            return
+        print(f"removed {out_path}")
+
+    def watch(self):
+        stats = self.stat_files()
+        self.build(stats)
+        print(f"watching {self.src_dir} for changes...")
+        try:
+            while True:
+                time.sleep(self.interval)
+                new_stats = self.stat_files()
+                if new_stats != stats:
+                    stats = self.wait_for_quiet(new_stats)
+                    self.build(stats)
+        except KeyboardInterrupt:
+            pass
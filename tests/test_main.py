@@ -0,0 +1,92 @@
+import io
+import os
+import sys
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from main import USAGE, main, parse_args
+from nc_transpiler import transpile
+
+VALID_SOURCE = "fn main() i32 {\n    var example i32 = 1 + 3 * 2;\n}\n"
+
+
+class ParseArgsTest(unittest.TestCase):
+    def test_defaults(self):
+        self.assertEqual(parse_args([]), ("test_file.mc", None, False))
+        self.assertEqual(parse_args(["--watch"]), (".", None, True))
+
+    def test_file_and_output(self):
+        self.assertEqual(parse_args(["a.mc", "-o", "a.c"]), ("a.mc", "a.c", False))
+        self.assertEqual(parse_args(["--output", "a.c", "a.mc"]), ("a.mc", "a.c", False))
+        self.assertEqual(parse_args(["--watch", "src", "-o", "out"]), ("src", "out", True))
+
+    def test_output_without_value(self):
+        with self.assertRaises(SystemExit) as cm:
+            parse_args(["a.mc", "-o"])
+        self.assertEqual(cm.exception.code, f"{USAGE}\nerror: -o expects a path")
+
+    def test_unknown_option(self):
+        with self.assertRaises(SystemExit) as cm:
+            parse_args(["-x", "a.mc"])
+        self.assertEqual(cm.exception.code, f"{USAGE}\nerror: unknown option -x")
+
+    def test_help(self):
+        out = io.StringIO()
+        with redirect_stdout(out), self.assertRaises(SystemExit) as cm:
+            parse_args(["-h"])
+        self.assertEqual(cm.exception.code, 0)
+        self.assertEqual(out.getvalue(), USAGE + "\n")
+
+
+class MainTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def write_source(self, contents):
+        path = os.path.join(self.tmp_dir.name, "a.mc")
+        with open(path, "wb") as f:
+            f.write(contents.encode() if isinstance(contents, str) else contents)
+        return path
+
+    def test_output_file(self):
+        src_path = self.write_source(VALID_SOURCE)
+        out_path = os.path.join(self.tmp_dir.name, "a.c")
+        self.assertEqual(main([src_path, "-o", out_path]), 0)
+        with open(out_path) as f:
+            self.assertEqual(f.read(), transpile(VALID_SOURCE, src_path))
+
+    def test_missing_file(self):
+        with self.assertRaises(SystemExit) as cm:
+            main([os.path.join(self.tmp_dir.name, "missing.mc")])
+        self.assertIsInstance(cm.exception.code, str)
+        self.assertIn("missing.mc", cm.exception.code)
+
+    def test_syntax_error(self):
+        src_path = self.write_source("fn main(\n")
+        with self.assertRaises(SystemExit) as cm:
+            main([src_path])
+        self.assertIsInstance(cm.exception.code, str)
+        self.assertTrue(cm.exception.code.startswith("Syntax Error"))
+
+    def test_invalid_utf8(self):
+        src_path = self.write_source(VALID_SOURCE.encode() + b"\xff")
+        with self.assertRaises(SystemExit) as cm:
+            main([src_path])
+        self.assertIsInstance(cm.exception.code, str)
+
+    def test_watch_requires_directory(self):
+        src_path = self.write_source(VALID_SOURCE)
+        for path in (src_path, os.path.join(self.tmp_dir.name, "missing")):
+            with self.assertRaises(SystemExit) as cm:
+                main(["--watch", path])
+            self.assertEqual(cm.exception.code, f"{USAGE}\nerror: {path} is not a directory")
+
+
+if __name__ == "__main__":
+    unittest.main()
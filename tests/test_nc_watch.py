@@ -0,0 +1,120 @@
+import io
+import os
+import sys
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from unittest import mock
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from nc_watch import Watcher
+
+VALID_SOURCE = "fn main() i32 {\n    var example i32 = 1 + 3 * 2;\n}\n"
+INVALID_SOURCE = "fn main(\n"
+
+
+class WatcherTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.src_dir = os.path.join(self.tmp_dir.name, "src")
+        self.out_dir = os.path.join(self.tmp_dir.name, "out")
+        os.makedirs(self.src_dir)
+        self.watcher = Watcher(self.src_dir, self.out_dir)
+        self.mtime_ns = 1_000_000_000_000_000_000
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def write_source(self, name, contents):
+        path = os.path.join(self.src_dir, name)
+        with open(path, "wb") as f:
+            f.write(contents.encode() if isinstance(contents, str) else contents)
+        self.touch(name)
+        return path
+
+    def touch(self, name):
+        # explicit timestamps keep the tests independent of the filesystem's mtime resolution
+        self.mtime_ns += 1_000_000_000
+        os.utime(os.path.join(self.src_dir, name), ns=(self.mtime_ns, self.mtime_ns))
+
+    def build(self):
+        out = io.StringIO()
+        with redirect_stdout(out):
+            written = self.watcher.build(self.watcher.stat_files())
+        return written, out.getvalue()
+
+    def out_mtime(self, name):
+        return os.stat(os.path.join(self.out_dir, name)).st_mtime_ns
+
+    def test_touch_with_same_hash_skips_rebuild(self):
+        path = self.write_source("a.mc", VALID_SOURCE)
+        self.assertEqual(self.build()[0], [path])
+        self.touch("a.mc")
+        self.assertEqual(self.build()[0], [])
+        self.assertFalse(self.watcher.manifest[path].failed)
+
+    def test_unchanged_output_is_not_rewritten(self):
+        self.write_source("a.mc", VALID_SOURCE)
+        self.build()
+        out_mtime = self.out_mtime("a.c")
+        self.write_source("a.mc", VALID_SOURCE + "\n\n")
+        self.assertEqual(self.build()[0], [])
+        self.assertEqual(self.out_mtime("a.c"), out_mtime)
+
+    def test_syntax_error_is_retried_only_after_own_change(self):
+        self.write_source("a.mc", VALID_SOURCE)
+        bad_path = self.write_source("b.mc", INVALID_SOURCE)
+        _, output = self.build()
+        self.assertIn("Syntax Error", output)
+        self.assertTrue(self.watcher.manifest[bad_path].failed)
+
+        self.write_source("a.mc", VALID_SOURCE.replace("1 + 3", "2 + 3"))
+        _, output = self.build()
+        self.assertNotIn("Syntax Error", output)
+
+        self.touch("b.mc")
+        _, output = self.build()
+        self.assertIn("Syntax Error", output)
+
+        self.write_source("b.mc", VALID_SOURCE)
+        self.assertEqual(self.build()[0], [bad_path])
+        self.assertFalse(self.watcher.manifest[bad_path].failed)
+
+    def test_bad_file_does_not_crash(self):
+        self.write_source("a.mc", VALID_SOURCE)
+        self.write_source("b.mc", VALID_SOURCE.encode() + b"\xff")
+        self.write_source("c.mc", "fn main() i32 {\n    5;\n}\n")
+        written, _ = self.build()
+        self.assertEqual(written, [os.path.join(self.src_dir, "a.mc")])
+        self.assertTrue(os.path.exists(os.path.join(self.out_dir, "a.c")))
+        self.assertFalse(os.path.exists(os.path.join(self.out_dir, "b.c")))
+        self.assertFalse(os.path.exists(os.path.join(self.out_dir, "c.c")))
+
+    def test_deleted_source_removes_output(self):
+        path = self.write_source("a.mc", VALID_SOURCE)
+        self.build()
+        os.remove(path)
+        self.build()
+        self.assertNotIn(path, self.watcher.manifest)
+        self.assertFalse(os.path.exists(os.path.join(self.out_dir, "a.c")))
+
+    def test_output_is_replaced_atomically(self):
+        self.write_source("a.mc", VALID_SOURCE)
+        self.build()
+        with open(os.path.join(self.out_dir, "a.c")) as f:
+            old_text = f.read()
+
+        self.write_source("a.mc", VALID_SOURCE.replace("1 + 3", "2 + 3"))
+        with mock.patch("nc_watch.os.replace", side_effect=KeyboardInterrupt), self.assertRaises(KeyboardInterrupt):
+            self.build()
+        with open(os.path.join(self.out_dir, "a.c")) as f:
+            self.assertEqual(f.read(), old_text)
+        self.assertEqual(os.listdir(self.out_dir), ["a.c"])
+
+        self.build()
+        self.assertEqual(os.listdir(self.out_dir), ["a.c"])
+
+
+if __name__ == "__main__":
+    unittest.main()